@@ -6,10 +6,10 @@ https://peps.python.org/pep-0440
 __version__ = "1.0.0"
 
 import re
-from copy import deepcopy
 from enum import Enum
-from itertools import zip_longest
-from typing import Any, ClassVar, Final, List, Literal, Optional, Tuple, Union
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, ClassVar, Final, Iterable, List, Literal, Optional, Tuple, Union
 
 VERSION_SUBPATTERNS: Final = {
     "epoch": r"([0-9]+!)?",
@@ -27,9 +27,28 @@ VERSION_PATTERN_WITH_GROUPS: Final = (
     + r"\s*"
 )
 
+# The same segments as above, matched one after another. Unlike a single pattern this never
+# backtracks across segments, so alternatives are ordered longest first.
+# The input is lowercased beforehand, which is cheaper than matching case-insensitively.
+_EPOCH_PATTERN: Final = re.compile(r"[0-9]+!")
+_RELEASE_PATTERN: Final = re.compile(r"[0-9]+(\.[0-9]+)*")
+_PRE_PATTERN: Final = re.compile(r"[-_\.]?(alpha|a|beta|b|rc|c|preview|pre)[-_\.]?[0-9]*")
+_POST_PATTERN: Final = re.compile(r"(-[0-9]+)|([-_\.]?(post|rev|r)[-_\.]?[0-9]*)")
+_DEV_PATTERN: Final = re.compile(r"[-_\.]?dev[-_\.]?[0-9]*")
+_LOCAL_PATTERN: Final = re.compile(r"\+[a-z0-9]+([-_\.][a-z0-9]+)*")
+
+# Table for str.translate() that drops every ASCII character except for digits
+_NON_DIGITS: Final = str.maketrans(
+    "", "", "".join(chr(c) for c in range(128) if not chr(c).isdigit())
+)
+
 ReleasePart = Literal["major", "minor", "micro"]
 Pre = Tuple[Literal["a", "b", "rc"], int]
 RELEASE_ORDER: Final[List[ReleasePart]] = ["major", "minor", "micro"]
+# epoch, release, pre, post, dev, local
+_Fields = Tuple[
+    Optional[int], Tuple[int, ...], Optional[Pre], Optional[int], Optional[int], Optional[str]
+]
 
 
 class VersionPart(Enum):
@@ -45,19 +64,29 @@ class VersionPart(Enum):
     DEV = "dev"
 
 
-class Version:
+# Part that differs first for a given release index (the last one stands for all the rest)
+_RELEASE_PARTS: Final = (
+    VersionPart.MAJOR,
+    VersionPart.MINOR,
+    VersionPart.MICRO,
+    VersionPart.RELEASE,
+)
+# Position of the remaining comparable parts in Version._sort_key
+_SUFFIX_PARTS: Final = ((2, VersionPart.PRE), (3, VersionPart.POST), (4, VersionPart.DEV))
+
+
+class Version:  # pylint: disable=too-many-instance-attributes
     """A single fixed version of something. Versions can be compared and updated."""
 
+    __slots__ = ("_epoch", "_release", "_pre", "_post", "_dev", "_local", "_key", "_str")
+
     PATTERN: ClassVar = re.compile(VERSION_PATTERN_WITH_GROUPS, re.IGNORECASE)
     FIELDS: ClassVar = ["epoch", "release", "pre", "post", "dev", "local"]
     ORDER: ClassVar = ["epoch", "major", "minor", "micro", "release", "pre", "post", "dev", "local"]
 
-    epoch: Optional[int]
-    release: Tuple[int, ...]
-    pre: Optional[Pre]
-    post: Optional[int]
-    dev: Optional[int]
-    local: Optional[str]
+    # Derived from the fields once and dropped whenever one of the fields is assigned
+    _key: Optional[Tuple[Any, ...]]
+    _str: Optional[str]
 
     @classmethod
     def parse(cls, string: str):
@@ -71,41 +100,61 @@ class Version:
         1.2.3.4.5.dev2+1.2
         11-12
         """
-        match = cls.PATTERN.fullmatch(string)
-        if match is None:
+        fields = _parse_fields(string)
+        if fields is None:
             raise ValueError(f"'{string}' does not look like a PEP 440 version")
-        local = match.group("local")
-        return cls(
-            epoch=_int_or_none(match.group("epoch")),
-            release=_parse_release(match.group("release")),
-            pre=_parse_pre(match.group("pre")),
-            post=_parse_post(match.group("post")),
-            dev=_int_or_none(match.group("dev")),
-            local=local[1:] if local else None,
-        )
+        epoch, release, pre, post, dev, local = fields
+        return cls(release, pre, post, dev, epoch=epoch, local=local)
+
+    @classmethod
+    def parse_many(cls, strings: Iterable[str]) -> List["Version"]:
+        """
+        Parse each of provided strings as a version, same as parse() would.
+        Slightly cheaper than calling parse() in a loop, as the lookups are done only once.
+        """
+        parse_fields = _parse_fields
+        result = []
+        for string in strings:
+            fields = parse_fields(string)
+            if fields is None:
+                raise ValueError(f"'{string}' does not look like a PEP 440 version")
+            epoch, release, pre, post, dev, local = fields
+            result.append(cls(release, pre, post, dev, epoch=epoch, local=local))
+        return result
+
+    @staticmethod
+    def bulk_sort(versions: Iterable["Version"], *, reverse: bool = False) -> List["Version"]:
+        """
+        Sort provided versions, same as sorted() would.
+        Faster for large collections, as each version's sort key is computed only once
+        and compared directly instead of going through the comparison operators.
+        """
+        return sorted(versions, key=attrgetter("_sort_key"), reverse=reverse)
 
     def public(self) -> str:
         """Get the public part of this version's"""
+        release = _format_release(self._release)
+        if self._epoch is None and self._pre is None and self._post is None and self._dev is None:
+            return release
         # Using a .join method is one of the faster and more memory
         # efficient ways of building strings and we utilize it to full effect.
-        result: List[Any] = []
-        if self.epoch is not None:
-            result.append(self.epoch)
-            result.append("!")
-        result.extend(".".join(str(part) for part in self.release))
-        if self.pre is not None:
-            result.extend(self.pre)
-        if self.post is not None:
-            result.append(".post")
-            result.append(self.post)
-        if self.dev is not None:
-            result.append(".dev")
-            result.append(self.dev)
-        return "".join(str(part) for part in result)
+        result: List[str] = []
+        if self._epoch is not None:
+            result.append(f"{self._epoch}!")
+        result.append(release)
+        if self._pre is not None:
+            result.append(f"{self._pre[0]}{self._pre[1]}")
+        if self._post is not None:
+            result.append(f".post{self._post}")
+        if self._dev is not None:
+            result.append(f".dev{self._dev}")
+        return "".join(result)
 
     def is_final(self) -> bool:
         """Check whether this version is final (only contains release and maybe epoch)."""
-        return all(getattr(self, field) is None for field in ["pre", "post", "dev", "local"])
+        return (
+            self._pre is None and self._post is None and self._dev is None and self._local is None
+        )
 
     def make_final(self) -> "Version":
         """Drop the non-final segments of this version."""
@@ -125,29 +174,24 @@ class Version:
         str(Version.parse("1.2.3").update("minor", -1)) == "1.1"
         str(Version.parse("1.2.3.4.5").update("release")) == "1.2.3.4.6"
         """
-        version = deepcopy(self)
         if not isinstance(part, VersionPart):
             part = VersionPart(part)
 
-        clear = False
-        for field in VersionPart:
-            if field == part:
-                if field == VersionPart.PRE:
-                    prefix, value = getattr(version, field.value) or ("a", 0)
-                    value = prefix, value + change
-                elif field == VersionPart.RELEASE:
-                    value = *version.release[:-1], version.release[-1] + change
-                else:
-                    value = (getattr(version, field.value) or 0) + change
-                setattr(version, field.value, value)
-                clear = True
-                continue
-
-            if field != VersionPart.RELEASE and clear:
-                setattr(version, field.value, None)
-        version.local = None
-
-        return version
+        cls = type(self)
+        if part is VersionPart.PRE:
+            prefix, value = self.pre or ("a", 0)
+            return cls(self.release, (prefix, value + change), epoch=self.epoch)
+        if part is VersionPart.POST:
+            return cls(self.release, self.pre, (self.post or 0) + change, epoch=self.epoch)
+        if part is VersionPart.DEV:
+            dev = (self.dev or 0) + change
+            return cls(self.release, self.pre, self.post, dev, epoch=self.epoch)
+        if part is VersionPart.RELEASE:
+            return cls((*self.release[:-1], self.release[-1] + change), epoch=self.epoch)
+        if part is VersionPart.EPOCH:
+            # the release can not be dropped entirely, so it starts over instead
+            return cls(0, epoch=(self.epoch or 0) + change)
+        return self.update_release(_RELEASE_PARTS.index(part), change)
 
     def update_release(
         self,
@@ -166,10 +210,7 @@ class Version:
             idx = RELEASE_ORDER.index(idx)
 
         if len(self.release) <= idx:
-            release = (
-                *tuple(part for part, _ in zip_longest(self.release, range(idx), fillvalue=0)),
-                change,
-            )
+            release = *self.release, *(0,) * (idx - len(self.release)), change
         else:
             release = *self.release[:idx], self.release[idx] + change
         return type(self)(epoch=self.epoch, release=release)
@@ -187,9 +228,14 @@ class Version:
         if keep == 0:
             keep = 1
 
-        version = deepcopy(self)
-        version.release = _truncate(version.release, keep)
-        return version
+        return type(self)(
+            _truncate(self.release, keep),
+            self.pre,
+            self.post,
+            self.dev,
+            epoch=self.epoch,
+            local=self.local,
+        )
 
     @property
     def major(self) -> int:
@@ -235,8 +281,20 @@ class Version:
         Find the biggest part (segment) that is different between 2 versions.
         Returns None if the versions are the same.
         """
-        for part in VersionPart:
-            if getattr(self, part.value) != getattr(other, part.value):
+        # pylint: disable=protected-access
+        key, other_key = self._sort_key, other._sort_key
+        if key[0] != other_key[0]:
+            return VersionPart.EPOCH
+        release, other_release = key[1], other_key[1]
+        if release != other_release:
+            idx = min(len(release), len(other_release))
+            for i, (left, right) in enumerate(zip(release, other_release)):
+                if left != right:
+                    idx = i
+                    break
+            return _RELEASE_PARTS[min(idx, len(_RELEASE_PARTS) - 1)]
+        for i, part in _SUFFIX_PARTS:
+            if key[i] != other_key[i]:
                 return part
         return None
 
@@ -250,20 +308,89 @@ class Version:
         epoch: Optional[int] = None,
         local: Optional[str] = None,
     ) -> None:
-        self.epoch = epoch
+        self._epoch = epoch
         if isinstance(release, int):
-            self.release = (release,)
+            self._release: Tuple[int, ...] = (release,)
         else:
-            self.release = release
-        self.pre = pre
-        self.post = post
-        self.dev = dev
-        self.local = local
+            self._release = release
+        self._pre = pre
+        self._post = post
+        self._dev = dev
+        self._local = local
+        self._key = None
+        self._str = None
+
+    def _changed(self) -> None:
+        self._key = None
+        self._str = None
+
+    @property
+    def epoch(self) -> Optional[int]:
+        """Epoch of the version, used when the versioning scheme changes."""
+        return self._epoch
+
+    @epoch.setter
+    def epoch(self, value: Optional[int]) -> None:
+        self._epoch = value
+        self._changed()
+
+    @property
+    def release(self) -> Tuple[int, ...]:
+        """Numeric segments of the version, such as (1, 2, 3) for 1.2.3."""
+        return self._release
+
+    @release.setter
+    def release(self, value: Tuple[int, ...]) -> None:
+        self._release = value
+        self._changed()
+
+    @property
+    def pre(self) -> Optional[Pre]:
+        """Pre-release segment, such as ("rc", 1) for 1.2rc1."""
+        return self._pre
+
+    @pre.setter
+    def pre(self, value: Optional[Pre]) -> None:
+        self._pre = value
+        self._changed()
+
+    @property
+    def post(self) -> Optional[int]:
+        """Post-release segment."""
+        return self._post
+
+    @post.setter
+    def post(self, value: Optional[int]) -> None:
+        self._post = value
+        self._changed()
+
+    @property
+    def dev(self) -> Optional[int]:
+        """Development release segment."""
+        return self._dev
+
+    @dev.setter
+    def dev(self, value: Optional[int]) -> None:
+        self._dev = value
+        self._changed()
+
+    @property
+    def local(self) -> Optional[str]:
+        """Local version label, the part after '+'."""
+        return self._local
+
+    @local.setter
+    def local(self, value: Optional[str]) -> None:
+        self._local = value
+        self._changed()
 
     def __str__(self) -> str:
-        result = self.public()
-        if self.local is not None:
-            result += f"+{self.local}"
+        result = self._str
+        if result is None:
+            result = self.public()
+            if self._local is not None:
+                result += f"+{self._local}"
+            self._str = result
         return result
 
     def __repr__(self) -> str:
@@ -278,15 +405,32 @@ class Version:
         return f'Value({", ".join(args)})'
 
     def __hash__(self) -> int:
-        return hash(tuple(getattr(self, field) for field in self.FIELDS))
+        return hash(self._sort_key)
 
-    def _less(self, other: "Version", *, if_equal: bool) -> bool:
-        for field in self.FIELDS:
-            diff = _lt_or_none(getattr(self, field), getattr(other, field))
-            if diff is not None:
-                return diff
+    @property
+    def _sort_key(self) -> Tuple[Any, ...]:
+        """
+        Tuple that orders the same way as the version itself, computed once per instance.
+        Optional parts are paired with whether they are present, so missing ones sort first
+        and are never compared to actual values.
+        """
+        key = self._key
+        if key is None:
+            key = self._key = (
+                (self._epoch is not None, self._epoch),
+                self._release,
+                (self._pre is not None, self._pre),
+                (self._post is not None, self._post),
+                (self._dev is not None, self._dev),
+                (self._local is not None, self._local),
+            )
+        return key
 
-        return if_equal
+    def _less(self, other: "Version", *, if_equal: bool) -> bool:
+        # pylint: disable=protected-access
+        if if_equal:
+            return self._sort_key <= other._sort_key
+        return self._sort_key < other._sort_key
 
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, Version):
@@ -299,14 +443,11 @@ class Version:
         return self._less(other, if_equal=True)
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Version):
             return NotImplemented
-
-        for field in self.FIELDS:
-            if getattr(self, field) != getattr(other, field):
-                return False
-
-        return True
+        return self._sort_key == other._sort_key  # pylint: disable=protected-access
 
     def __ne__(self, other: object) -> bool:
         return not self == other
@@ -322,23 +463,77 @@ class Version:
         return not self._less(other, if_equal=False)  # note that if equal is inverted
 
 
+@lru_cache(maxsize=4096)
+def _parse_fields(string: str) -> Optional[_Fields]:
+    """
+    Parse provided string into the raw fields of a version, or None if it is not a version.
+    Results are cached, as the same few versions tend to be parsed over and over again.
+    Only immutable values are cached, so every parse still produces a fresh Version.
+    """
+    string = string.strip().lower()
+    pos = 1 if string[:1] == "v" else 0
+    # Plain releases like "1.2.3" are by far the most common, so skip the patterns for them.
+    parts = string[pos:].split(".")
+    if string.isascii() and all(map(str.isdigit, parts)):
+        return None, tuple(map(int, parts)), None, None, None, None
+
+    epoch, pos = _match_segment(_EPOCH_PATTERN, string, pos)
+    release, pos = _match_segment(_RELEASE_PATTERN, string, pos)
+    if release is None:
+        return None
+    pre, pos = _match_segment(_PRE_PATTERN, string, pos)
+    post, pos = _match_segment(_POST_PATTERN, string, pos)
+    dev, pos = _match_segment(_DEV_PATTERN, string, pos)
+    local, pos = _match_segment(_LOCAL_PATTERN, string, pos)
+    if pos != len(string):
+        return None
+    return (
+        _int_or_none(epoch),
+        _parse_release(release),
+        _parse_pre(pre),
+        _parse_post(post),
+        _int_or_none(dev),
+        local[1:] if local else None,
+    )
+
+
+def _match_segment(pattern: "re.Pattern[str]", string: str, pos: int) -> Tuple[Optional[str], int]:
+    """Match an optional segment at given position, returning it and the position after it."""
+    match = pattern.match(string, pos)
+    if match is None:
+        return None, pos
+    return match.group(), match.end()
+
+
 def _int_or_none(string: Optional[str]) -> Optional[int]:
     """Map strings to integers and falsy strings to Nones"""
     if not string:
         return None
-    return int(re.sub(r"[^0-9]", "", string) or 0)
+    # epoch and dev segments only ever surround their number with these characters
+    return int(string.strip("-_.!dev") or 0)
+
+
+def _format_release(release: Tuple[int, ...]) -> str:
+    # Most releases have 2 or 3 parts, which a fixed f-string formats about twice as fast.
+    if len(release) == 3:
+        major, minor, micro = release
+        return f"{major}.{minor}.{micro}"
+    if len(release) == 2:
+        major, minor = release
+        return f"{major}.{minor}"
+    return ".".join(map(str, release))
 
 
 def _parse_release(string: str) -> Tuple[int, ...]:
     parts = string.split(".")
-    return tuple(int(part) for part in parts)
+    return tuple(map(int, parts))
 
 
 def _parse_pre(string: Optional[str]) -> Optional[Pre]:
     if not string:
         return None
     prefix: Literal["a", "b", "rc"]
-    string = string.strip(".-_").lower()
+    string = string.strip(".-_")
     if string.startswith(("a", "alpha")):
         prefix = "a"
     elif string.startswith(("b", "beta")):
@@ -348,29 +543,19 @@ def _parse_pre(string: Optional[str]) -> Optional[Pre]:
     else:
         raise ValueError(f"'{string}' is not a valid pre-release segment")
 
-    numeric = re.sub(r"[^0-9]", "", string)
+    numeric = string.translate(_NON_DIGITS)
     return prefix, int(numeric or 0)
 
 
 def _parse_post(string: Optional[str]) -> Optional[int]:
     if not string:
         return None
-    if string.startswith("-") and string[1:].isnumeric():
-        return int(string[1:])
-    return int(string.strip("._-postrev") or 0)
-
-
-def _lt_or_none(left: Optional[Any], right: Optional[Any]) -> Optional[bool]:
-    """None is always considered smaller than something. If the items are equal returns None."""
-    if left is None:
-        if right is None:
-            return None
-        return True
-    if right is None:
-        return False
-    if left == right:
-        return None
-    return left < right
+    string = string.lstrip("-_.")
+    for prefix in ("post", "rev", "r"):
+        if string.startswith(prefix):
+            string = string[len(prefix) :].lstrip("-_.")
+            break
+    return int(string or 0)
 
 
 def _truncate(value: Tuple[int, ...], keep: int) -> Tuple[int, ...]:
@@ -1,3 +1,4 @@
+from copy import deepcopy
 from typing import Tuple
 
 import pytest
@@ -46,6 +47,10 @@ def test_parse(string: str, expected: Version) -> None:
     ["original", "normalized", "value"],
     [
         ["01", "1", Version(1)],
+        [" v1.2 ", "1.2", Version((1, 2))],
+        ["V3", "3", Version(3)],
+        ["1.0RC1", "1.0rc1", Version((1, 0), ("rc", 1))],
+        ["1.0+ABC.def", "1.0+abc.def", Version((1, 0), local="abc.def")],
         ["0.02", "0.2", Version((0, 2))],
         ["0.1alpha2", "0.1a2", Version((0, 1), ("a", 2))],
         ["0.1.a2", "0.1a2", Version((0, 1), ("a", 2))],
@@ -58,10 +63,13 @@ def test_parse(string: str, expected: Version) -> None:
         ["0.1-r", "0.1.post0", Version((0, 1), post=0)],
         ["0.1_post", "0.1.post0", Version((0, 1), post=0)],
         ["0.1-11", "0.1.post11", Version((0, 1), post=11)],
+        ["0.1.POST2", "0.1.post2", Version((0, 1), post=2)],
+        ["0.1-Rev_3", "0.1.post3", Version((0, 1), post=3)],
         ["0.1.dev", "0.1.dev0", Version((0, 1), dev=0)],
         ["0.1-dev1", "0.1.dev1", Version((0, 1), dev=1)],
         ["0.1_dev2", "0.1.dev2", Version((0, 1), dev=2)],
         ["0.1dev3", "0.1.dev3", Version((0, 1), dev=3)],
+        ["2!0.1.DEV4", "2!0.1.dev4", Version(epoch=2, release=(0, 1), dev=4)],
     ],
 )
 def test_normalize(original: str, normalized: str, value: Version) -> None:
@@ -116,6 +124,8 @@ def test_version_order() -> None:
 
     sorted_versions = sorted(versions)
     assert sorted_versions == versions
+    assert Version.bulk_sort(reversed(versions)) == versions
+    assert Version.bulk_sort(versions, reverse=True) == versions[::-1]
 
     reverse_versions = sorted(versions, reverse=True)
     for before, after in zip(reverse_versions, reverse_versions[1:]):
@@ -142,10 +152,15 @@ def test_version_order() -> None:
         [Version((1, 2, 3), ("b", 4), 5), ["post"], Version((1, 2, 3), ("b", 4), 6)],
         [Version((1, 2, 3), ("b", 4), 5, 6), ["post"], Version((1, 2, 3), ("b", 4), 6)],
         [Version((1, 2, 3), ("b", 4), 5), ["dev"], Version((1, 2, 3), ("b", 4), 5, 1)],
+        [Version((1, 2), ("b", 4), epoch=1), ["epoch"], Version(0, epoch=2)],
+        [Version((1, 2), local="x"), ["micro"], Version((1, 2, 1))],
+        [Version((1, 2, 3, 4)), ["micro"], Version((1, 2, 4))],
     ],
 )
 def test_update(initial: Version, args: Tuple[str, int], expected: Version) -> None:
+    original = str(initial)
     assert initial.update(*args) == expected
+    assert str(initial) == original
 
 
 @pytest.mark.parametrize(
@@ -174,6 +189,7 @@ def test_update_release(initial: Version, args: Tuple[int, int], expected: Versi
         [Version((0, 0, 0, 0)), 0, Version((0))],
         [Version((0, 0, 0, 0)), 2, Version((0, 0))],
         [Version((1, 0, 0, 0)), 2, Version((1, 0))],
+        [Version((1, 0, 0), ("b", 1), local="x"), 0, Version(1, ("b", 1), local="x")],
     ]
 )
 def test_truncate(initial: Version, keep: int, expected: Version) -> None:
@@ -214,3 +230,79 @@ def test_different_at(left: Version, right: Version, part: VersionPart) -> None:
     if part is not None and not isinstance(part, VersionPart):
         part = VersionPart(part)
     assert left.different_at(right) == part
+
+
+def test_parse_cached() -> None:
+    first = Version.parse("1.2.3")
+    second = Version.parse("1.2.3")
+    assert first == second
+    assert first is not second
+
+    first.minor = 5
+    assert Version.parse("1.2.3") == Version((1, 2, 3))
+
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            Version.parse("not a version")
+
+
+def test_parse_many() -> None:
+    strings = ["1.2.3", "v2", "1!0.1rc1+abc", "1.2.3"]
+    assert Version.parse_many(strings) == [Version.parse(string) for string in strings]
+    assert Version.parse_many(iter([])) == []
+    with pytest.raises(ValueError):
+        Version.parse_many(["1.2", "one.two"])
+
+
+@pytest.mark.parametrize("string", ["", "v", "1.", ".1", "1..2", "vv1", "1.\u0662"])
+def test_parse_invalid(string: str) -> None:
+    with pytest.raises(ValueError):
+        Version.parse(string)
+
+
+def test_copy() -> None:
+    version = Version((1, 2, 3), ("rc", 1), 2, 3, epoch=4, local="local")
+    copied = deepcopy(version)
+    assert copied == version
+    assert copied is not version
+    assert not hasattr(version, "__dict__")
+
+
+def test_equal_to_itself() -> None:
+    # NaN is unequal to itself, so only the identity check can make this version equal
+    version = Version(1, post=float("nan"))  # type: ignore[arg-type]
+    assert version == version  # pylint: disable=comparison-with-itself
+    assert version != Version(1, post=float("nan"))  # type: ignore[arg-type]
+
+
+def test_hash() -> None:
+    versions = {Version((1, 2)): "1.2", Version((1, 2), post=0): "1.2.post0"}
+    assert versions[Version.parse("1.2")] == "1.2"
+    assert versions[Version.parse("1.2.post0")] == "1.2.post0"
+    assert Version.parse("1.2.3") in {Version((1, 2, 3))}
+
+
+def test_order_after_change() -> None:
+    version = Version((1, 2, 3))
+    assert version < Version(2)
+    version.major = 3
+    assert version > Version(2)
+    version.post = 1
+    assert version > Version((3, 2, 3))
+
+
+def test_order_missing_parts() -> None:
+    # parts that are present always come after missing ones, whatever their value
+    assert Version(1) < Version(1, post=-1)
+    assert Version(1) != Version(1, post=-1)
+    assert Version(1) < Version(1, local="")
+    assert Version(1) != Version(1, local="")
+
+
+def test_str_after_change() -> None:
+    version = Version.parse("1.2.3")
+    assert str(version) == "1.2.3"
+    version.micro = None
+    assert str(version) == "1.2"
+    version.local = "abc"
+    assert str(version) == "1.2+abc"